@@ -7,14 +7,12 @@ import asyncio
 import logging
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
-import schedule
-import time
 from dotenv import load_dotenv
 
-from scraper import PasardanaScraper
+from scraper import PasardanaScraper, new_event_loop
 
 # Load environment variables
 load_dotenv()
@@ -37,7 +35,13 @@ class PasardanaPipeline:
     def __init__(self):
         self.schedule_time = os.getenv('SCRAPE_SCHEDULE_TIME', '09:00')
         self.headless = os.getenv('HEADLESS_MODE', 'true').lower() == 'true'
-        self.scraper = PasardanaScraper(headless=self.headless)
+        self.output_formats = [
+            fmt.strip() for fmt in os.getenv('OUTPUT_FORMATS', 'feather,parquet').split(',') if fmt.strip()
+        ]
+        # The browser is only launched if a run falls back to it, then kept open until close()
+        self.scraper = PasardanaScraper(headless=self.headless, keep_browser=True)
+        # One event loop for the pipeline's lifetime so the browser survives between runs
+        self.loop = new_event_loop()
 
     async def run_scraper_job(self):
         """
@@ -51,7 +55,7 @@ class PasardanaPipeline:
         logger.info("=" * 60)
 
         try:
-            saved_files = await self.scraper.run(output_formats=['csv', 'json'])
+            saved_files = await self.scraper.run(output_formats=self.output_formats)
 
             if saved_files:
                 logger.info("Scrape job completed successfully")
@@ -77,7 +81,17 @@ class PasardanaPipeline:
         Returns:
             bool: True if successful, False otherwise
         """
-        return asyncio.run(self.run_scraper_job())
+        if self.scraper.is_running:
+            logger.warning("Previous scrape job is still running, skipping this run")
+            return False
+        return self.loop.run_until_complete(self.run_scraper_job())
+
+    def close(self):
+        """Shut down the browser and the pipeline's event loop"""
+        if self.loop.is_closed():
+            return
+        self.loop.run_until_complete(self.scraper.close())
+        self.loop.close()
 
     def run_once(self):
         """
@@ -87,22 +101,73 @@ class PasardanaPipeline:
             bool: True if successful, False otherwise
         """
         logger.info("Running scraper once (immediate execution)")
-        return self.run_scraper_sync()
+        try:
+            return self.run_scraper_sync()
+        finally:
+            self.close()
 
-    def run_scheduled(self):
-        """Run the scraper on a schedule"""
-        logger.info(f"Setting up scheduled scraping at {self.schedule_time} daily")
-        schedule.every().day.at(self.schedule_time).do(self.run_scraper_sync)
+    def _next_daily_run(self, now: datetime) -> datetime:
+        """
+        Compute the next time the daily schedule fires
 
-        logger.info("Pipeline is running. Press Ctrl+C to stop.")
-        logger.info(f"Next run scheduled at: {self.schedule_time}")
+        Args:
+            now: Current local time
+
+        Returns:
+            Next run time, today if still ahead, otherwise tomorrow
+        """
+        time_format = '%H:%M:%S' if self.schedule_time.count(':') == 2 else '%H:%M'
+        at = datetime.strptime(self.schedule_time, time_format).time()
+        next_run = datetime.combine(now.date(), at)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return next_run
+
+    async def _run_daily(self):
+        """Sleep until the scheduled time each day and run the scraper job"""
+        while True:
+            next_run = self._next_daily_run(datetime.now())
+            logger.info(f"Next run scheduled at: {next_run}")
+            await asyncio.sleep((next_run - datetime.now()).total_seconds())
+            await self.run_scraper_job()
+
+    async def _run_every(self, hours: int):
+        """
+        Run the scraper job immediately, then again each time the interval elapses
+
+        Args:
+            hours: Number of hours between runs
+        """
+        logger.info("Running initial scrape...")
+        while True:
+            await self.run_scraper_job()
+            logger.info(f"Next run in {hours} hours")
+            await asyncio.sleep(hours * 3600)
 
+    def _run_forever(self, job):
+        """
+        Drive a long-running job coroutine on the pipeline's event loop until interrupted
+
+        Args:
+            job: Coroutine to run
+        """
+        logger.info("Pipeline is running. Press Ctrl+C to stop.")
+        task = self.loop.create_task(job)
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            self.loop.run_until_complete(task)
         except KeyboardInterrupt:
             logger.info("Pipeline stopped by user")
+            task.cancel()
+            self.loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        finally:
+            self.close()
+
+    def run_scheduled(self):
+        """Run the scraper on a schedule"""
+        logger.info(f"Setting up scheduled scraping at {self.schedule_time} daily")
+        # Validate the time before entering the loop
+        self._next_daily_run(datetime.now())
+        self._run_forever(self._run_daily())
 
     def run_interval(self, hours: int = 24):
         """
@@ -112,20 +177,7 @@ class PasardanaPipeline:
             hours: Number of hours between runs
         """
         logger.info(f"Setting up scraping every {hours} hours")
-        schedule.every(hours).hours.do(self.run_scraper_sync)
-
-        # Run once immediately
-        logger.info("Running initial scrape...")
-        self.run_scraper_sync()
-
-        logger.info("Pipeline is running. Press Ctrl+C to stop.")
-
-        try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-        except KeyboardInterrupt:
-            logger.info("Pipeline stopped by user")
+        self._run_forever(self._run_every(hours))
 
 
 def main():
@@ -150,6 +202,8 @@ Environment Variables:
   SCRAPE_SCHEDULE_TIME: Default schedule time (default: 09:00)
   HEADLESS_MODE: Run browser in headless mode (default: true)
   DATA_OUTPUT_DIR: Directory for output files (default: ./data)
+  OUTPUT_FORMATS: Comma-separated output formats (default: feather,parquet)
+  CSV_COMPRESSION_LEVEL: gzip level for CSV/JSON output, 0 to disable (default: 1)
   LOG_LEVEL: Logging level (default: INFO)
         """
     )
@@ -4,15 +4,22 @@ Scrapes daily mutual fund data from pasardana.id with pagination support
 """
 
 import asyncio
+import gzip
+import itertools
 import logging
 import os
+import re
+import shutil
 import sys
+from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
+import lxml.html
 import pandas as pd
-from playwright.async_api import async_playwright, Page, Browser
+import requests
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -29,18 +36,460 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# Leading integer of a pagination link's text (mirrors JavaScript's parseInt)
+PAGE_NUMBER_RE = re.compile(r'-?\d+')
+
+# Browser-side scripts, defined once and passed to Playwright as-is
+
+# Table headers (with empty trailing columns removed) and row cell texts in one round-trip
+EXTRACT_TABLE_JS = '''() => {
+    let headerCells = document.querySelectorAll('table thead th');
+    if (headerCells.length === 0) {
+        // Fall back to any header cell in the table
+        headerCells = document.querySelectorAll('table th');
+    }
+    const headers = Array.from(headerCells).map(th => th.innerText.trim());
+
+    // Remove empty trailing columns
+    while (headers.length && headers[headers.length - 1] === '') {
+        headers.pop();
+    }
+
+    // Skip empty rows (no cells, or a single blank cell) before they cross the wire
+    const rows = Array.from(document.querySelectorAll('table tbody tr'))
+        .map(row => Array.from(row.querySelectorAll('td')).map(cell => cell.innerText.trim()))
+        .filter(cells => cells.length > 1 || (cells.length === 1 && cells[0] !== ''));
+    return {
+        headers: headers,
+        rows: rows
+    };
+}'''
+
+# Whether the first matched page button is disabled or already active, or null if none matched
+PAGE_BUTTON_STATE_JS = '''(elements) => {
+    const element = elements[0];
+    if (!element) {
+        return null;
+    }
+    return Boolean(element.disabled ||
+                   element.classList.contains('disabled') ||
+                   element.parentElement?.classList.contains('disabled') ||
+                   element.parentElement?.classList.contains('active'));
+}'''
+
+# True once the first table row differs from the given text
+TABLE_CHANGED_JS = '''(previous) => {
+    const row = document.querySelector('table tbody tr');
+    return row !== null && row.innerText !== previous;
+}'''
+
+# Tracker hosts that don't affect the fund table
+BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'facebook.com',
+    'hotjar.com',
+)
+
+# Chromium flags that skip images and resolve tracker hosts to nothing. Done at launch rather than
+# with context.route(), because request routing disables the HTTP cache of the persistent profile.
+# Stylesheets are kept because innerText depends on layout.
+CHROMIUM_ARGS = [
+    '--blink-settings=imagesEnabled=false',
+    '--host-resolver-rules=' + ', '.join(f'MAP *{host} ~NOTFOUND' for host in BLOCKED_HOSTS),
+]
+
+# Injected into every page: clicks the cookie consent button as soon as it is rendered,
+# watching DOM changes until a click or a few seconds after the load event
+COOKIE_CONSENT_JS = '''(() => {
+    const accept = () => {
+        for (const button of document.querySelectorAll('button')) {
+            if (/Accept|Setuju/i.test(button.textContent || '') || button.closest('.cookie-consent')) {
+                button.click();
+                return true;
+            }
+        }
+        return false;
+    };
+    const observer = new MutationObserver(() => {
+        if (accept()) {
+            observer.disconnect();
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true});
+    // With consent already stored no banner appears, so stop watching shortly after load
+    window.addEventListener('load', () => setTimeout(() => observer.disconnect(), 3000));
+})();'''
+
+# File extension used for each supported output format
+OUTPUT_EXTENSIONS = {
+    'feather': 'feather',
+    'parquet': 'parquet',
+    'csv': 'csv',
+    'json': 'json',
+    'excel': 'xlsx',
+}
+
+
+def open_text_output(path: Path, compression_level: int):
+    """
+    Open a CSV/JSON output file for binary writing
+
+    Args:
+        path: Destination path
+        compression_level: gzip level; 0 writes the file uncompressed
+
+    Returns:
+        Writable binary file object
+    """
+    if compression_level > 0:
+        return gzip.GzipFile(path, 'wb', compresslevel=compression_level, mtime=1)
+    return open(path, 'wb')
+
+
+def encode_json_records(df: pd.DataFrame) -> Iterator[bytes]:
+    """
+    Encode DataFrame rows one at a time as JSON objects with orjson
+
+    Args:
+        df: DataFrame to encode
+
+    Returns:
+        Iterator over the encoded records
+    """
+    import orjson
+
+    columns = [str(column) for column in df.columns]
+    for row in df.itertuples(index=False, name=None):
+        yield orjson.dumps(dict(zip(columns, row)), option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def low_cardinality_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Find text columns whose values repeat enough to be worth dictionary encoding
+
+    Args:
+        df: DataFrame to inspect
+
+    Returns:
+        Names of the text columns with fewer distinct values than half the rows
+    """
+    return [
+        column for column in df.select_dtypes(include=['object', 'string']).columns
+        if df[column].nunique() < len(df) / 2
+    ]
+
+
+def arrow_schema(df: pd.DataFrame, dictionary_columns: List[str]):
+    """
+    Build the Arrow schema for a DataFrame, storing the given text columns as dictionaries
+
+    Args:
+        df: DataFrame to describe
+        dictionary_columns: Columns to dictionary encode
+
+    Returns:
+        pyarrow Schema
+    """
+    import pyarrow as pa
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    for column in dictionary_columns:
+        index = schema.get_field_index(column)
+        field_type = schema.field(index).type
+        if pa.types.is_string(field_type) or pa.types.is_large_string(field_type):
+            schema = schema.set(index, schema.field(index).with_type(pa.dictionary(pa.int32(), pa.string())))
+    return schema
+
+
+class PageWriter(ABC):
+    """Base for writers that append scraped pages to an output file as they arrive"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.partial_path = path.with_name(path.name + '.partial')
+        self.rows_written = 0
+        # Columns of the first page written; later pages are aligned to them
+        self.columns: Optional[List[str]] = None
+
+    def write(self, df: pd.DataFrame):
+        """
+        Append one page of data to the file
+
+        Args:
+            df: DataFrame for a single page
+        """
+        if df.empty:
+            return
+
+        if self.columns is None:
+            self._open(df)
+            self.columns = list(df.columns)
+        else:
+            # Pages are expected to share headers; align any stragglers to the first page's columns
+            extra = set(df.columns) - set(self.columns)
+            if extra:
+                logger.warning(f"Dropping columns not present on the first page: {sorted(extra)}")
+            df = df.reindex(columns=self.columns, fill_value='')
+
+        self._append(df)
+        self.rows_written += len(df)
+
+    def close(self, success: bool = True):
+        """
+        Finish the file, moving it into place only if the scrape succeeded
+
+        Args:
+            success: Whether to keep the written data
+        """
+        finished = False
+        try:
+            if self.columns is not None:
+                self._finish()
+            finished = True
+        finally:
+            if finished and success and self.rows_written:
+                os.replace(self.partial_path, self.path)
+            elif self.partial_path.exists():
+                self.partial_path.unlink()
+
+    @abstractmethod
+    def _open(self, df: pd.DataFrame):
+        """Create the partial file, using the first page for the header or schema"""
+
+    @abstractmethod
+    def _append(self, df: pd.DataFrame):
+        """Write one page, already aligned to the first page's columns"""
+
+    @abstractmethod
+    def _finish(self):
+        """Flush and close the partial file"""
+
+
+class FeatherPageWriter(PageWriter):
+    """Append scraped pages to a feather (Arrow IPC) file as record batches"""
+
+    def _open(self, df: pd.DataFrame):
+        # pyarrow is only needed for the columnar formats, so import it lazily
+        import pyarrow as pa
+
+        # Repeating columns are picked from the first page and dictionary encoded like save_data does
+        self._schema = arrow_schema(df, low_cardinality_columns(df))
+        self._dictionaries: Dict[str, Dict[str, int]] = {
+            field.name: {} for field in self._schema if pa.types.is_dictionary(field.type)
+        }
+        self._writer = pa.ipc.new_file(
+            str(self.partial_path), self._schema,
+            options=pa.ipc.IpcWriteOptions(compression='zstd', emit_dictionary_deltas=True)
+        )
+
+    def _append(self, df: pd.DataFrame):
+        import pyarrow as pa
+
+        arrays = []
+        for field in self._schema:
+            values = df[field.name]
+            if field.name in self._dictionaries:
+                # The IPC file format can't replace a dictionary between batches, so each page
+                # only appends its new values to it and the writer emits them as a delta
+                codes = self._dictionaries[field.name]
+                for value in values.dropna().unique():
+                    codes.setdefault(value, len(codes))
+                categorical = pd.Categorical(values, categories=list(codes))
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(categorical.codes, type=pa.int32(), mask=categorical.codes == -1),
+                    pa.array(list(codes), type=pa.string())
+                ))
+            else:
+                arrays.append(pa.array(values, type=field.type, from_pandas=True))
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+
+    def _finish(self):
+        self._writer.close()
+
+
+class ParquetPageWriter(PageWriter):
+    """Append scraped pages to a parquet file, buffering them into row groups"""
+
+    # Pages hold a few dozen rows; group them so the file isn't split into tiny row groups
+    ROW_GROUP_ROWS = 50000
+
+    def _open(self, df: pd.DataFrame):
+        # pyarrow is only needed for the columnar formats, so import it lazily
+        import pyarrow.parquet as pq
+
+        # Repeating columns are picked from the first page and stored as dictionaries like save_data does
+        self._schema = arrow_schema(df, low_cardinality_columns(df))
+        self._writer = pq.ParquetWriter(str(self.partial_path), self._schema, compression='zstd')
+        self._pending: List[pd.DataFrame] = []
+        self._pending_rows = 0
+
+    def _append(self, df: pd.DataFrame):
+        self._pending.append(df)
+        self._pending_rows += len(df)
+        if self._pending_rows >= self.ROW_GROUP_ROWS:
+            self._flush()
+
+    def _flush(self):
+        import pyarrow as pa
+
+        if self._pending:
+            group = pd.concat(self._pending, ignore_index=True)
+            self._writer.write_table(pa.Table.from_pandas(group, schema=self._schema, preserve_index=False))
+            self._pending = []
+            self._pending_rows = 0
+
+    def _finish(self):
+        self._flush()
+        self._writer.close()
+
+
+class CsvPageWriter(PageWriter):
+    """Append scraped pages to a CSV file, gzip compressed unless compression_level is 0"""
+
+    def __init__(self, path: Path, compression_level: int):
+        super().__init__(path)
+        self.compression_level = compression_level
+
+    def _open(self, df: pd.DataFrame):
+        self._file = open_text_output(self.partial_path, self.compression_level)
+        self._file.write(df.iloc[:0].to_csv(index=False).encode('utf-8-sig'))
+
+    def _append(self, df: pd.DataFrame):
+        self._file.write(df.to_csv(index=False, header=False).encode('utf-8'))
+        self._file.flush()
+
+    def _finish(self):
+        self._file.close()
+
+
+class JsonPageWriter(PageWriter):
+    """Append scraped pages to a JSON array of records, gzip compressed unless compression_level is 0"""
+
+    def __init__(self, path: Path, compression_level: int):
+        super().__init__(path)
+        self.compression_level = compression_level
+
+    def _open(self, df: pd.DataFrame):
+        self._file = open_text_output(self.partial_path, self.compression_level)
+        self._file.write(b'[')
+        self._separator = b''
+
+    def _append(self, df: pd.DataFrame):
+        for record in encode_json_records(df):
+            self._file.write(self._separator + record)
+            self._separator = b','
+        self._file.flush()
+
+    def _finish(self):
+        self._file.write(b']\n')
+        self._file.close()
+
 
 class PasardanaScraper:
     """Scraper for pasardana.id mutual fund data"""
 
-    def __init__(self, headless: bool = True):
+    # Selector strategies for a numbered page button; format with page=<number>
+    PAGE_BUTTON_SELECTOR = ', '.join([
+        'a.page-link:text("{page}")',
+        'button.page-link:text("{page}")',
+        'a[aria-label="Page {page}"]',
+        'button[aria-label="Page {page}"]',
+        '.page-item a:text("{page}")',
+        '.pagination a:text("{page}")',
+    ])
+
+    def __init__(self, headless: bool = True, keep_browser: bool = False):
         self.base_url = "https://pasardana.id/fund/search"
+        # JSON endpoint behind the fund table; when set, the browser is only a fallback
+        self.api_url = os.getenv('FUND_API_URL', '')
+        # Try fetching server-rendered HTML over plain HTTP before starting a browser
+        self.static_fetch = os.getenv('STATIC_FETCH', 'true').lower() == 'true'
         self.headless = headless
+        # Leave the browser running between scrapes; the owner calls close() when done
+        self.keep_browser = keep_browser
         self.max_retries = int(os.getenv('MAX_RETRIES', 3))
+        self.max_parallel_pages = max(1, int(os.getenv('MAX_PARALLEL_PAGES', 3)))
         self.data_output_dir = Path(os.getenv('DATA_OUTPUT_DIR', './data'))
         self.data_output_dir.mkdir(exist_ok=True)
+        # Chromium profile (cookies, HTTP cache, compiled JS) kept between runs. Chromium locks it
+        # while running, so by default it lives outside the (possibly shared) data directory.
+        self.profile_dir = Path(
+            os.getenv('BROWSER_PROFILE_DIR') or '~/.cache/pasardana/browser-profile'
+        ).expanduser()
+        # gzip level for CSV/JSON output; 0 writes them uncompressed
+        self.compression_level = int(os.getenv('CSV_COMPRESSION_LEVEL', 1))
+        self._playwright = None
+        self.context: Optional[BrowserContext] = None
+        # Only set when the profile could not be used and a plain browser was launched instead
+        self._browser: Optional[Browser] = None
+        self._inflight = asyncio.Semaphore(1)
+        # Raw headers of the last page and their cleaned column names; pages share headers
+        self._cleaned_headers = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a scrape+save run is currently in progress"""
+        return self._inflight.locked()
+
+    async def start(self):
+        """Launch the browser with the persistent profile, reusing it if it is already running"""
+        if self.context is not None:
+            return
+        await self.close()
+        self._playwright = await async_playwright().start()
+        try:
+            context = await self._playwright.chromium.launch_persistent_context(
+                str(self.profile_dir), headless=self.headless, user_agent=USER_AGENT, args=CHROMIUM_ARGS
+            )
+            logger.info(f"Browser launched with profile {self.profile_dir}")
+        except Exception as e:
+            # e.g. the profile is locked by another scraper process or container
+            logger.warning(f"Could not use browser profile {self.profile_dir} ({e}), launching without it")
+            self._browser = await self._playwright.chromium.launch(headless=self.headless, args=CHROMIUM_ARGS)
+            context = await self._browser.new_context(user_agent=USER_AGENT)
+            logger.info("Browser launched")
+        context.on('close', self._on_context_closed)
+        await context.add_init_script(COOKIE_CONSENT_JS)
+        self.context = context
+
+    def _on_context_closed(self, context: BrowserContext):
+        """Forget the browser context once it has closed or crashed"""
+        if self.context is context:
+            self.context = None
+
+    async def close(self):
+        """Close the browser and stop Playwright"""
+        if self.context is not None:
+            try:
+                await self.context.close()
+            except Exception:
+                pass
+            self.context = None
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self):
+        # The browser is launched on first use and kept until the block exits
+        self.keep_browser = True
+        return self
 
-    async def scrape_page(self, page: Page, page_num: int) -> List[Dict]:
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def scrape_page(self, page: Page, page_num: int) -> pd.DataFrame:
         """
         Scrape data from a single page
 
@@ -49,153 +498,77 @@ class PasardanaScraper:
             page_num: Current page number
 
         Returns:
-            List of dictionaries containing fund data
+            DataFrame containing the page's fund data
         """
         logger.info(f"Scraping page {page_num}")
 
         try:
-            # Wait for table to load
-            await page.wait_for_selector('table', timeout=30000)
-
-            # Extract table data
-            table_data = await page.evaluate('''() => {
-                const rows = Array.from(document.querySelectorAll('table tbody tr'));
-                return rows.map(row => {
-                    const cells = Array.from(row.querySelectorAll('td'));
-                    return cells.map(cell => cell.innerText.trim());
-                });
-            }''')
-
-            # Get table headers
-            headers = await page.evaluate('''() => {
-                const headers = Array.from(document.querySelectorAll('table thead th'));
-                return headers.map(th => th.innerText.trim());
-            }''')
-
-            if not headers or len(headers) == 0:
-                # Try alternative selectors
-                headers = await page.evaluate('''() => {
-                    const headers = Array.from(document.querySelectorAll('table th'));
-                    return headers.map(th => th.innerText.trim());
-                }''')
-
-            # Clean up headers: remove empty trailing columns
-            while headers and headers[-1] == '':
-                headers.pop()
+            # The locator waits for the table and extracts headers and rows in a single round-trip.
+            # The script still queries the whole document, since headers may live in a separate table.
+            table = await page.locator('table').first.evaluate(EXTRACT_TABLE_JS, timeout=30000)
+            headers = table['headers']
+            table_data = table['rows']
 
-            # Remove duplicate empty headers by renaming them
-            header_counts = {}
-            cleaned_headers = []
-            for header in headers:
-                if header == '':
-                    count = header_counts.get('_empty_', 0)
-                    cleaned_headers.append(f'_empty_{count}')
-                    header_counts['_empty_'] = count + 1
-                else:
-                    cleaned_headers.append(header)
-            headers = cleaned_headers
-
-            logger.info(f"Found {len(headers)} columns: {headers[:10]}..." if len(headers) > 10 else f"Found {len(headers)} columns: {headers}")
-            logger.info(f"Found {len(table_data)} rows on page {page_num}")
-
-            # Convert to list of dictionaries
-            records = []
-            for row_data in table_data:
-                # Skip empty rows (single column with no data)
-                if len(row_data) == 1 and not row_data[0]:
-                    continue
-
-                # Pad row data with empty strings if it's shorter than headers
-                if len(row_data) < len(headers):
-                    row_data = row_data + [''] * (len(headers) - len(row_data))
-                # Truncate row data if it's longer than headers
-                elif len(row_data) > len(headers):
-                    logger.warning(f"Row data length ({len(row_data)}) exceeds headers ({len(headers)}), truncating")
-                    row_data = row_data[:len(headers)]
-
-                record = dict(zip(headers, row_data))
-                record['scraped_at'] = datetime.now().isoformat()
-                record['page_number'] = page_num
-                records.append(record)
-
-            return records
+            return self._build_page_frame(headers, table_data, page_num)
 
         except Exception as e:
             logger.error(f"Error scraping page {page_num}: {str(e)}")
-            return []
+            return pd.DataFrame()
 
-    async def check_next_page(self, page: Page) -> bool:
+    def _build_page_frame(self, headers: List[str], table_data: List[List[str]], page_num: int) -> pd.DataFrame:
         """
-        Check if there's a next page and navigate to it
+        Turn extracted table headers and rows into a page DataFrame
 
         Args:
-            page: Playwright page object
+            headers: Header texts, with empty trailing headers already removed
+            table_data: Cell texts for each row, with empty rows already removed
+            page_num: Page number the rows came from
 
         Returns:
-            True if successfully navigated to next page, False otherwise
+            DataFrame containing the page's fund data
         """
-        try:
-            # Common pagination selectors
-            next_selectors = [
-                'a.page-link:has-text("Next")',
-                'button:has-text("Next")',
-                'a:has-text("›")',
-                'button:has-text("›")',
-                'a.next',
-                'button.next',
-                'li.next a',
-                'li.pagination-next a',
-                '[aria-label="Next"]',
-                '.pagination .next:not(.disabled) a',
-            ]
-
-            for selector in next_selectors:
-                try:
-                    next_button = await page.query_selector(selector)
-                    if next_button:
-                        is_disabled = await next_button.evaluate('''(element) => {
-                            return element.disabled ||
-                                   element.classList.contains('disabled') ||
-                                   element.parentElement.classList.contains('disabled');
-                        }''')
-
-                        if not is_disabled:
-                            logger.info(f"Found next button with selector: {selector}")
-                            await next_button.click()
-                            await page.wait_for_load_state('load', timeout=30000)
-                            await asyncio.sleep(3)  # Additional wait for dynamic content
-                            return True
-                except Exception:
-                    continue
-
-            # Try pagination by page numbers
-            try:
-                current_page_elem = await page.query_selector('.pagination .active, .page-item.active')
-                if current_page_elem:
-                    # Get next page number
-                    current_text = await current_page_elem.inner_text()
-                    try:
-                        current_num = int(current_text.strip())
-                        next_num = current_num + 1
-                        next_page_selector = f'a.page-link:has-text("{next_num}")'
-                        next_page = await page.query_selector(next_page_selector)
-                        if next_page:
-                            logger.info(f"Navigating to page {next_num}")
-                            await next_page.click()
-                            await page.wait_for_load_state('load', timeout=30000)
-                            await asyncio.sleep(3)
-                            return True
-                    except ValueError:
-                        pass
-            except Exception:
-                pass
+        # Every page has the same headers, so only clean them when they change
+        raw_headers = tuple(headers)
+        cached = self._cleaned_headers
+        if cached is None or cached[0] != raw_headers:
+            if cached is not None:
+                logger.info(f"Headers changed on page {page_num}, recomputing column names")
+            # Remove duplicate empty headers by renaming them
+            empty_ids = itertools.count()
+            cached = (raw_headers, [header if header else f'_empty_{next(empty_ids)}' for header in headers])
+            self._cleaned_headers = cached
+            logger.info(f"Found {len(headers)} columns: {cached[1][:10]}..." if len(headers) > 10 else f"Found {len(headers)} columns: {cached[1]}")
+        headers = cached[1]
 
-            logger.info("No next page found")
-            return False
+        logger.info(f"Found {len(table_data)} rows on page {page_num}")
 
-        except Exception as e:
-            logger.error(f"Error checking for next page: {str(e)}")
-            return False
+        # Pad/truncate rows to the header width
+        ncols = len(headers)
+        overlong = sum(1 for row in table_data if len(row) > ncols)
+        if overlong:
+            logger.warning(f"{overlong} rows exceed headers ({ncols}), truncating")
+        table_data = [row[:ncols] + [''] * (ncols - len(row)) for row in table_data]
+
+        df = pd.DataFrame(table_data, columns=headers)
+        df['scraped_at'] = datetime.now().isoformat()
+        df['page_number'] = page_num
+
+        return df
+
+    async def _click_and_wait_for_table(self, page: Page, control):
+        """
+        Click a pagination control and wait until the table shows different rows
+
+        Args:
+            page: Playwright page object
+            control: Locator or element handle to click
+        """
+        # Remember the current first row so we can tell when the table has been replaced
+        first_row = await page.locator('table tbody tr').first.all_inner_texts()
+        previous_first_row = first_row[0] if first_row else ''
+
+        await control.click()
+        await page.wait_for_function(TABLE_CHANGED_JS, arg=previous_first_row, timeout=15000)
 
     async def navigate_to_page(self, page: Page, page_number: int) -> bool:
         """
@@ -211,59 +584,26 @@ class PasardanaScraper:
         try:
             logger.info(f"Attempting to navigate to page {page_number}")
 
-            # Wait a bit before attempting to click
-            await asyncio.sleep(2)
-
-            # Try multiple selector strategies to find the page number button
-            selectors = [
-                f'a.page-link:text("{page_number}")',
-                f'button.page-link:text("{page_number}")',
-                f'a[aria-label="Page {page_number}"]',
-                f'button[aria-label="Page {page_number}"]',
-                f'.page-item a:text("{page_number}")',
-                f'.pagination a:text("{page_number}")',
-            ]
-
-            page_button = None
-            for selector in selectors:
-                try:
-                    page_button = await page.query_selector(selector)
-                    if page_button:
-                        logger.info(f"Found page button with selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            # One locator over every selector strategy for the page number button,
+            # then a single evaluate for whether it exists and can be clicked
+            candidates = page.locator(self.PAGE_BUTTON_SELECTOR.format(page=page_number))
+            is_disabled = await candidates.evaluate_all(PAGE_BUTTON_STATE_JS)
+            page_button = candidates.first
 
-            if not page_button:
+            if is_disabled is None:
                 logger.warning(f"Could not find button for page {page_number}")
                 return False
 
-            # Check if the button is disabled
-            is_disabled = await page_button.evaluate('''(element) => {
-                return element.disabled ||
-                       element.classList.contains('disabled') ||
-                       element.parentElement?.classList.contains('disabled') ||
-                       element.parentElement?.classList.contains('active');
-            }''')
-
             if is_disabled:
                 logger.info(f"Page {page_number} button is disabled or active (already on this page)")
                 return False
 
             # Scroll button into view
             await page_button.scroll_into_view_if_needed()
-            await asyncio.sleep(1)
 
-            # Click the page button
+            # Click the page button and wait for the table to be updated
             logger.info(f"Clicking page {page_number} button")
-            await page_button.click()
-
-            # Wait for navigation/content to load
-            await asyncio.sleep(4)
-
-            # Wait for table to be updated
-            await page.wait_for_selector('table tbody tr', timeout=15000)
-            await asyncio.sleep(2)
+            await self._click_and_wait_for_table(page, page_button)
 
             logger.info(f"Successfully navigated to page {page_number}")
             return True
@@ -283,21 +623,13 @@ class PasardanaScraper:
             Total number of pages
         """
         try:
-            total_pages = await page.evaluate('''() => {
-                // Find all page number links
-                const pageLinks = document.querySelectorAll('.page-link, .page-item a, .pagination a');
-                let maxPage = 1;
-
-                pageLinks.forEach(link => {
-                    const text = link.textContent.trim();
-                    const pageNum = parseInt(text);
-                    if (!isNaN(pageNum) && pageNum > maxPage) {
-                        maxPage = pageNum;
-                    }
-                });
-
-                return maxPage;
-            }''')
+            # Find all page number links and take the largest number among them
+            link_texts = await page.locator('.page-link, .page-item a, .pagination a').all_text_contents()
+            total_pages = 1
+            for text in link_texts:
+                match = PAGE_NUMBER_RE.match(text.strip())
+                if match:
+                    total_pages = max(total_pages, int(match.group()))
 
             logger.info(f"Detected {total_pages} total pages")
             return max(1, total_pages)
@@ -306,149 +638,729 @@ class PasardanaScraper:
             logger.warning(f"Error detecting total pages: {e}. Defaulting to 1 page.")
             return 1
 
-    async def scrape_all_pages(self) -> pd.DataFrame:
+    def _fetch_api_page(self, session: requests.Session, page_num: int) -> Optional[Dict]:
         """
-        Scrape all pages by clicking through pagination buttons
+        Fetch one page of the fund list from the JSON API
+
+        Args:
+            session: HTTP session to reuse connections
+            page_num: Page number to fetch
 
         Returns:
-            DataFrame containing all scraped data
+            Decoded JSON payload, or None if the request failed
         """
-        all_data = []
-        page_num = 1
+        try:
+            response = session.get(self.api_url, params={'page': page_num}, timeout=30)
+            if response.status_code != 200:
+                logger.warning(f"API returned {response.status_code} for page {page_num}")
+                return None
+            return response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"API request for page {page_num} failed: {e}")
+            return None
+
+    @staticmethod
+    def _api_records(payload) -> List[Dict]:
+        """
+        Pull the list of fund records out of an API payload
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
+        Args:
+            payload: Decoded JSON payload
 
-            try:
-                logger.info(f"Navigating to {self.base_url}")
-                # Use domcontentloaded instead of networkidle for better reliability in CI environments
-                # Retry up to 3 times if navigation fails
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        await page.goto(self.base_url, wait_until='domcontentloaded', timeout=90000)
-                        logger.info(f"Successfully loaded page on attempt {attempt + 1}")
-                        break
-                    except Exception as e:
-                        if attempt < max_retries - 1:
-                            logger.warning(f"Navigation attempt {attempt + 1} failed: {e}. Retrying...")
-                            await asyncio.sleep(5)
-                        else:
-                            logger.error(f"All navigation attempts failed")
-                            raise
-
-                # Wait for content to load and any JavaScript to execute
-                await asyncio.sleep(5)
-
-                # Check if we need to handle any popups or cookie consent
-                try:
-                    cookie_selectors = ['button:has-text("Accept")', 'button:has-text("Setuju")', '.cookie-consent button']
-                    for selector in cookie_selectors:
-                        cookie_btn = await page.query_selector(selector)
-                        if cookie_btn:
-                            await cookie_btn.click()
-                            await asyncio.sleep(1)
-                            break
-                except Exception:
-                    pass
-
-                # Wait for initial table to load
-                await page.wait_for_selector('table tbody tr', timeout=30000)
-                await asyncio.sleep(3)
-
-                # Detect total number of pages
-                total_pages = await self.get_total_pages(page)
-                logger.info(f"Will attempt to scrape {total_pages} pages")
-
-                # Scrape first page
-                logger.info("Scraping page 1")
-                page_data = await self.scrape_page(page, page_num)
-                all_data.extend(page_data)
-                logger.info(f"Page 1: Scraped {len(page_data)} records")
-
-                # Scrape remaining pages
-                for page_num in range(2, total_pages + 1):
-                    # Navigate to next page
-                    success = await self.navigate_to_page(page, page_num)
-
-                    if not success:
-                        logger.warning(f"Failed to navigate to page {page_num}, stopping pagination")
-                        break
+        Returns:
+            List of fund records
+        """
+        if isinstance(payload, list):
+            return payload
+        if isinstance(payload, dict):
+            for key in ('data', 'items', 'results', 'funds'):
+                if isinstance(payload.get(key), list):
+                    return payload[key]
+        return []
+
+    @staticmethod
+    def _api_total_pages(payload) -> Optional[int]:
+        """
+        Read the page count from an API payload if it reports one
 
-                    # Scrape the page
-                    page_data = await self.scrape_page(page, page_num)
+        Args:
+            payload: Decoded JSON payload
 
-                    if not page_data:
-                        logger.warning(f"No data found on page {page_num}, stopping pagination")
-                        break
+        Returns:
+            Total number of pages, or None if unknown
+        """
+        if isinstance(payload, dict):
+            for key in ('last_page', 'total_pages', 'totalPages', 'pageCount'):
+                if isinstance(payload.get(key), int):
+                    return payload[key]
+        return None
 
-                    all_data.extend(page_data)
-                    logger.info(f"Page {page_num}: Scraped {len(page_data)} records (Total so far: {len(all_data)})")
+    async def scrape_api(self) -> Optional[pd.DataFrame]:
+        """
+        Scrape all pages from the JSON API configured in FUND_API_URL, without a browser
 
-                    # Safety limit to prevent infinite loops
-                    if page_num >= 1000:
-                        logger.warning("Reached maximum page limit (1000), stopping")
+        Returns:
+            DataFrame containing all scraped data, or None to fall back to the browser
+        """
+        logger.info(f"Fetching fund data from API {self.api_url}")
+        scraped_at = datetime.now().isoformat()
+
+        with requests.Session() as session:
+            session.headers['User-Agent'] = USER_AGENT
+            first = await asyncio.to_thread(self._fetch_api_page, session, 1)
+            if first is None:
+                return None
+
+            payloads = {1: first}
+            total_pages = self._api_total_pages(first)
+
+            if total_pages:
+                semaphore = asyncio.Semaphore(8)
+
+                async def fetch(page_num):
+                    async with semaphore:
+                        return await asyncio.to_thread(self._fetch_api_page, session, page_num)
+
+                pages = range(2, min(total_pages, 1000) + 1)
+                for page_num, payload in zip(pages, await asyncio.gather(*[fetch(n) for n in pages])):
+                    if payload is None:
+                        return None
+                    payloads[page_num] = payload
+
+                # An endpoint that ignores the page parameter returns page 1 again
+                if 2 in payloads and self._api_records(payloads[2]) == self._api_records(first):
+                    logger.info("API ignores the page parameter, using the browser")
+                    return None
+            else:
+                # No page count in the payload: walk pages until one comes back empty or repeats the last
+                page_num = 1
+                while self._api_records(payloads[page_num]) and page_num < 1000:
+                    payload = await asyncio.to_thread(self._fetch_api_page, session, page_num + 1)
+                    if payload is None:
+                        return None
+                    if self._api_records(payload) == self._api_records(payloads[page_num]):
+                        if page_num == 1:
+                            logger.info("API ignores the page parameter, using the browser")
+                            return None
+                        logger.info(f"API page {page_num + 1} repeats page {page_num}, stopping")
                         break
+                    page_num += 1
+                    payloads[page_num] = payload
+
+        frames = []
+        for page_num, payload in payloads.items():
+            records = self._api_records(payload)
+            if records:
+                frame = pd.DataFrame(records)
+                frame['scraped_at'] = scraped_at
+                frame['page_number'] = page_num
+                frames.append(frame)
+
+        if not frames:
+            logger.warning("API returned no records")
+            return None
+
+        logger.info(f"Total records fetched from API: {sum(len(f) for f in frames)} from {len(payloads)} pages")
+        return pd.concat(frames, ignore_index=True)
+
+    def _fetch_html_page(self, session: requests.Session, page_num: int) -> Optional[str]:
+        """
+        Fetch the server-rendered HTML of one page of the fund list
+
+        Args:
+            session: HTTP session to reuse connections
+            page_num: Page number to fetch
+
+        Returns:
+            Page HTML, or None if the request failed
+        """
+        url = self.base_url if page_num == 1 else self.page_url(page_num)
+        try:
+            response = session.get(url, timeout=30)
+            if response.status_code != 200:
+                logger.warning(f"Got HTTP {response.status_code} for page {page_num}")
+                return None
+            return response.text
+        except requests.RequestException as e:
+            logger.warning(f"Request for page {page_num} failed: {e}")
+            return None
+
+    @staticmethod
+    def _parse_table_html(html: str):
+        """
+        Extract the fund table and page links from static HTML
+
+        Args:
+            html: Page HTML
+
+        Returns:
+            Tuple of (headers, rows, total_pages); rows is empty if the table is rendered by JavaScript
+        """
+        tree = lxml.html.fromstring(html)
+
+        def cell_text(cell):
+            return ' '.join(cell.text_content().split())
+
+        header_cells = tree.xpath('//table//thead//th') or tree.xpath('//table//th')
+        headers = [cell_text(th) for th in header_cells]
+        while headers and headers[-1] == '':
+            headers.pop()
+
+        # Browsers add a tbody when the markup omits it, so match data rows directly.
+        # Rows with a spanning cell are placeholders ("Memuat data...") or footers, not funds.
+        rows = [
+            [cell_text(td) for td in tr.xpath('./td')]
+            for tr in tree.xpath('//table//tr[td and not(td[@colspan > 1])]')
+        ]
+        rows = [row for row in rows if len(row) > 1 or row[0]]
+
+        total_pages = 1
+        page_links = tree.xpath(
+            "//*[contains(concat(' ', normalize-space(@class), ' '), ' page-link ')]"
+            " | //*[contains(concat(' ', normalize-space(@class), ' '), ' page-item ')]//a"
+            " | //*[contains(concat(' ', normalize-space(@class), ' '), ' pagination ')]//a"
+        )
+        for link in page_links:
+            match = PAGE_NUMBER_RE.match(link.text_content().strip())
+            if match:
+                total_pages = max(total_pages, int(match.group()))
+
+        return headers, rows, total_pages
+
+    @staticmethod
+    def _is_fund_table(headers: List[str], rows: List[List[str]], total_pages: int) -> bool:
+        """
+        Check that a table parsed from static HTML holds real fund rows
+
+        The fund grid is normally filled in by JavaScript, so the static HTML may only hold a
+        placeholder or an unrendered client-side template instead of data.
+
+        Args:
+            headers: Header texts
+            rows: Cell texts for each row
+            total_pages: Number of pages found in the pagination links
+
+        Returns:
+            True if the rows can be used without a browser
+        """
+        if not headers or not rows:
+            logger.info("Fund table is not in the static HTML, using the browser")
+            return False
+        if any('{{' in cell or '}}' in cell for row in rows for cell in row):
+            logger.info("Static HTML holds an unrendered table template, using the browser")
+            return False
+        full_rows = sum(1 for row in rows if len(row) >= len(headers))
+        if full_rows < 0.8 * len(rows):
+            logger.info("Static HTML rows don't match the table headers, using the browser")
+            return False
+        if total_pages < 2:
+            logger.info("No pagination in the static HTML, using the browser")
+            return False
+        return True
+
+    async def scrape_static(self) -> Optional[pd.DataFrame]:
+        """
+        Scrape all pages from server-rendered HTML over plain HTTP, without a browser
+
+        Returns:
+            DataFrame containing all scraped data, or None if the table needs JavaScript
+        """
+        logger.info(f"Trying static HTML fetch of {self.base_url}")
+
+        with requests.Session() as session:
+            session.headers['User-Agent'] = USER_AGENT
+
+            html = await asyncio.to_thread(self._fetch_html_page, session, 1)
+            if html is None:
+                return None
+            headers, rows, total_pages = self._parse_table_html(html)
+            if not self._is_fund_table(headers, rows, total_pages):
+                return None
+
+            frames = [self._build_page_frame(headers, rows, 1)]
+            total_pages = min(total_pages, 1000)
+            logger.info(f"Static HTML has the fund table, fetching {total_pages} pages")
+
+            semaphore = asyncio.Semaphore(16)
+
+            async def fetch(page_num):
+                async with semaphore:
+                    page_html = await asyncio.to_thread(self._fetch_html_page, session, page_num)
+                if page_html is None:
+                    return None
+                page_headers, page_rows, _ = self._parse_table_html(page_html)
+                return self._build_page_frame(page_headers, page_rows, page_num)
+
+            results = await asyncio.gather(*[fetch(n) for n in range(2, total_pages + 1)])
+
+        if any(frame is None for frame in results):
+            logger.warning("Some pages could not be fetched over HTTP, using the browser")
+            return None
+        if any(frame.empty for frame in results):
+            logger.info("Some pages have no table rows in the static HTML, using the browser")
+            return None
+        if results and self._same_rows(frames[0], results[0]):
+            logger.info("Page URL parameter not honoured over HTTP, using the browser")
+            return None
+
+        frames += results
+        logger.info(f"Total records fetched over HTTP: {sum(len(f) for f in frames)} from {total_pages} pages")
+        return pd.concat(frames, ignore_index=True)
+
+    def page_url(self, page_num: int) -> str:
+        """
+        Build the URL for a given page of the fund list
+
+        Args:
+            page_num: Page number
+
+        Returns:
+            URL of the page
+        """
+        return f"{self.base_url}?page={page_num}"
+
+    async def scrape_page_by_url(self, page: Page, page_num: int) -> pd.DataFrame:
+        """
+        Load a page number directly by URL and scrape it
+
+        Args:
+            page: Playwright page object to load the URL in
+            page_num: Page number to scrape
+
+        Returns:
+            DataFrame containing the page's fund data
+        """
+        try:
+            # Return once the response starts arriving; the table wait below gates the scrape
+            await page.goto(self.page_url(page_num), wait_until='commit', timeout=30000)
+            await page.wait_for_selector('table tbody tr', timeout=30000)
+            return await self.scrape_page(page, page_num)
+        except Exception as e:
+            logger.error(f"Error loading page {page_num}: {str(e)}")
+            return pd.DataFrame()
+
+    async def scrape_pages_parallel(self, context: BrowserContext, page_numbers: List[int],
+                                    on_page: Optional[Callable[[pd.DataFrame], None]] = None) -> List[pd.DataFrame]:
+        """
+        Scrape page numbers by URL with a small pool of tabs
+
+        Each worker opens one tab and keeps reusing it for the page numbers it pulls from a shared queue.
+        With on_page, each page is handed over in page order as soon as it and all earlier pages are
+        done, instead of being collected until the whole batch finishes.
 
-            except Exception as e:
-                logger.error(f"Error during scraping: {str(e)}")
-                raise
+        Args:
+            context: Browser context to open the tabs in
+            page_numbers: Page numbers to scrape, in order
+            on_page: Optional callback receiving each page's DataFrame
+
+        Returns:
+            DataFrames in the same order as page_numbers, or an empty list when on_page is given
+        """
+        queue = asyncio.Queue()
+        for page_num in page_numbers:
+            queue.put_nowait(page_num)
+        results = {}
+        next_index = 0
+
+        async def worker():
+            nonlocal next_index
+            page = await context.new_page()
+            try:
+                while not queue.empty():
+                    page_num = queue.get_nowait()
+                    results[page_num] = await self.scrape_page_by_url(page, page_num)
+                    if results[page_num].empty:
+                        logger.warning(f"No data found on page {page_num}")
+                    # Release every finished page that is next in order
+                    while on_page is not None and next_index < len(page_numbers) \
+                            and page_numbers[next_index] in results:
+                        on_page(results.pop(page_numbers[next_index]))
+                        next_index += 1
             finally:
-                await browser.close()
+                await page.close()
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_parallel_pages, len(page_numbers)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # Stop the other tabs as well, e.g. when on_page failed to write a page
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        if on_page is not None:
+            return []
+        return [results[page_num] for page_num in page_numbers]
+
+    @staticmethod
+    def _same_rows(first: pd.DataFrame, second: pd.DataFrame) -> bool:
+        """
+        Check whether two scraped pages hold the same fund rows
+
+        Args:
+            first: Data from one page
+            second: Data from another page
+
+        Returns:
+            True if the table contents are identical
+        """
+        # A page that failed to scrape is an empty frame without the metadata columns
+        metadata = ['scraped_at', 'page_number']
+        return first.drop(columns=metadata, errors='ignore').equals(second.drop(columns=metadata, errors='ignore'))
+
+    async def scrape_pages_sequential(self, page: Page, start_page: int, total_pages: int,
+                                      collect: Callable[[pd.DataFrame], int]) -> int:
+        """
+        Scrape pages one by one by clicking through the pagination buttons
+
+        Args:
+            page: Playwright page object, currently showing start_page - 1
+            start_page: First page number to scrape
+            total_pages: Last page number to scrape
+            collect: Callback receiving each page's DataFrame and returning the running record total
+
+        Returns:
+            Number of the last page visited
+        """
+        page_num = start_page - 1
+        for page_num in range(start_page, total_pages + 1):
+            # Navigate to next page
+            success = await self.navigate_to_page(page, page_num)
+
+            if not success:
+                logger.warning(f"Failed to navigate to page {page_num}, stopping pagination")
+                break
+
+            # Scrape the page
+            page_data = await self.scrape_page(page, page_num)
+
+            if page_data.empty:
+                logger.warning(f"No data found on page {page_num}, stopping pagination")
+                break
+
+            total_records = collect(page_data)
+            logger.info(f"Page {page_num}: Scraped {len(page_data)} records (Total so far: {total_records})")
+
+        return page_num
 
-        logger.info(f"Total records scraped: {len(all_data)} from {page_num} pages")
+    async def scrape_all_pages(self, page_writers: Optional[List[PageWriter]] = None,
+                               keep_frames: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Scrape all pages, loading them by ?page=N URL (in parallel) when the site honours it
+
+        Clicking through the pagination controls is only used when the URL parameter is ignored.
+
+        Args:
+            page_writers: Optional writers each page is streamed to as soon as it is scraped
+            keep_frames: Whether to keep the pages in memory and return them; when every output
+                is streamed by page_writers this can be False so pages are dropped once written
+
+        Returns:
+            DataFrame containing all scraped data, or None when keep_frames is False
+        """
+        frames = []
+        total_records = 0
+        page_num = 1
+
+        def collect(page_data: pd.DataFrame) -> int:
+            nonlocal total_records
+            if page_data.empty:
+                return total_records
+            total_records += len(page_data)
+            if keep_frames:
+                frames.append(page_data)
+            for page_writer in page_writers or []:
+                page_writer.write(page_data)
+            return total_records
+
+        # Launch the browser on first use; close it again afterwards unless it is kept for reuse
+        launched = self.context is None
+        if launched:
+            await self.start()
+
+        # Cookies and cached site assets from earlier runs come from the persistent profile
+        context = self.context
+        page = await context.new_page()
 
-        if not all_data:
+        try:
+            logger.info(f"Navigating to {self.base_url}")
+            # Only wait for the response to commit; the explicit table wait below decides when the page is ready
+            # Retry up to 3 times if navigation fails
+            max_retries = 3
+            for attempt in range(max_retries):
+                try:
+                    await page.goto(self.base_url, wait_until='commit', timeout=30000)
+                    logger.info(f"Successfully loaded page on attempt {attempt + 1}")
+                    break
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        logger.warning(f"Navigation attempt {attempt + 1} failed: {e}. Retrying...")
+                        await asyncio.sleep(5)
+                    else:
+                        logger.error(f"All navigation attempts failed")
+                        raise
+
+            # Wait for initial table to load
+            await page.wait_for_selector('table tbody tr', timeout=30000)
+
+            # Detect total number of pages
+            total_pages = await self.get_total_pages(page)
+
+            # Safety limit to prevent runaway scrapes
+            if total_pages > 1000:
+                logger.warning("Detected more than 1000 pages, limiting to 1000")
+                total_pages = 1000
+            logger.info(f"Will attempt to scrape {total_pages} pages")
+
+            # Scrape first page
+            logger.info("Scraping page 1")
+            page_data = await self.scrape_page(page, page_num)
+            collect(page_data)
+            logger.info(f"Page 1: Scraped {len(page_data)} records")
+
+            if total_pages > 1:
+                # Make sure ?page=N actually changes the table before loading pages by URL
+                probe_data, = await self.scrape_pages_parallel(context, [2])
+                if not probe_data.empty and not self._same_rows(page_data, probe_data):
+                    logger.info(f"Scraping pages 2-{total_pages} with {self.max_parallel_pages} parallel pages")
+                    collect(probe_data)
+                    await self.scrape_pages_parallel(context, list(range(3, total_pages + 1)), on_page=collect)
+                    page_num = total_pages
+                else:
+                    logger.warning("Page URL parameter not honoured, falling back to clicking through pages")
+                    page_num = await self.scrape_pages_sequential(page, 2, total_pages, collect)
+
+        except Exception as e:
+            logger.error(f"Error during scraping: {str(e)}")
+            raise
+        finally:
+            await page.close()
+            if launched and not self.keep_browser:
+                await self.close()
+
+        logger.info(f"Total records scraped: {total_records} from {page_num} pages")
+
+        if not keep_frames:
+            return None
+        if not frames:
             logger.warning("No data was scraped")
             return pd.DataFrame()
 
-        return pd.DataFrame(all_data)
+        return pd.concat(frames, ignore_index=True)
 
-    def save_data(self, df: pd.DataFrame, format: str = 'csv') -> Path:
+    def _text_compression(self) -> Optional[Dict]:
         """
-        Save scraped data to file
+        Build the pandas compression options for CSV/JSON output
+
+        Returns:
+            gzip options at the configured level, or None when compression is disabled
+        """
+        if self.compression_level <= 0:
+            return None
+        # Low gzip levels are far cheaper than pandas' default of 9 for a similar size
+        return {'method': 'gzip', 'compresslevel': self.compression_level, 'mtime': 1}
+
+    def _extension(self, format: str) -> str:
+        """
+        Get the file extension for an output format
 
         Args:
-            df: DataFrame containing scraped data
-            format: Output format ('csv', 'json', 'excel')
+            format: Output format
 
         Returns:
-            Path to saved file
+            File extension without the leading dot
+        """
+        extension = OUTPUT_EXTENSIONS[format]
+        if format in ('csv', 'json') and self.compression_level > 0:
+            extension += '.gz'
+        return extension
+
+    def _write_csv_fast(self, df: pd.DataFrame, filename: Path) -> bool:
+        """
+        Write CSV by formatting every cell in one pass with a precomputed row template
+
+        Only used when no value needs CSV quoting; otherwise the caller falls back to to_csv.
+
+        Args:
+            df: DataFrame to write
+            filename: Destination path
+
+        Returns:
+            True if the file was written, False if the DataFrame needs to_csv
+        """
+        if df.empty or df.isna().to_numpy().any():
+            return False
+
+        needs_quoting = r'[,"\r\n]'
+        if pd.Index(df.columns).astype(str).str.contains(needs_quoting).any():
+            return False
+        text_columns = df.select_dtypes(include=['object', 'string'])
+        if any(col.astype(str).str.contains(needs_quoting).any() for _, col in text_columns.items()):
+            return False
+
+        header = ','.join(map(str, df.columns)) + '\n'
+        row_fmt = ','.join(['{}'] * df.shape[1]) + '\n'
+        body = (row_fmt * len(df)).format(*df.to_numpy().ravel())
+        with open_text_output(filename, self.compression_level) as f:
+            f.write((header + body).encode('utf-8-sig'))
+        return True
+
+    def _write_json(self, df: pd.DataFrame, filename: Path):
+        """
+        Write a JSON array of records, encoding one row at a time with orjson
+
+        Rows are streamed to the file instead of first building the full list of record dicts.
+
+        Args:
+            df: DataFrame to write
+            filename: Destination path
+        """
+        with open_text_output(filename, self.compression_level) as f:
+            f.write(b'[')
+            for i, record in enumerate(encode_json_records(df)):
+                if i:
+                    f.write(b',')
+                f.write(record)
+            f.write(b']\n')
+
+    @staticmethod
+    def _write_excel(df: pd.DataFrame, filename: Path):
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        Write an Excel sheet row by row with xlsxwriter in constant_memory mode
 
+        constant_memory flushes a row as soon as a later row is started, so rows must be written
+        whole and in order. pandas' to_excel writes column by column, which would drop cells.
+
+        Args:
+            df: DataFrame to write
+            filename: Destination path
+        """
+        import xlsxwriter
+
+        # Missing values become blank cells; xlsxwriter rejects NaN
+        values = df.astype(object).where(df.notna(), None)
+        workbook = xlsxwriter.Workbook(str(filename), {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, [str(column) for column in df.columns])
+            for row_num, row in enumerate(values.itertuples(index=False, name=None), start=1):
+                worksheet.write_row(row_num, 0, row)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert low-cardinality text columns to categoricals for dictionary encoding
+
+        Args:
+            df: DataFrame to convert
+
+        Returns:
+            DataFrame with repeating text columns stored as categories
+        """
+        categorical = {column: df[column].astype('category') for column in low_cardinality_columns(df)}
+        return df.assign(**categorical) if categorical else df
+
+    def _write_file(self, df: pd.DataFrame, filename: Path, format: str):
+        """
+        Serialize a DataFrame to a single file in the given format
+
+        Args:
+            df: DataFrame to write
+            filename: Destination path
+            format: Output format
+        """
         if format == 'csv':
-            filename = self.data_output_dir / f'pasardana_funds_{timestamp}.csv'
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            if not self._write_csv_fast(df, filename):
+                df.to_csv(filename, index=False, encoding='utf-8-sig', compression=self._text_compression())
         elif format == 'json':
-            filename = self.data_output_dir / f'pasardana_funds_{timestamp}.json'
-            df.to_json(filename, orient='records', indent=2, force_ascii=False)
+            self._write_json(df, filename)
         elif format == 'excel':
-            filename = self.data_output_dir / f'pasardana_funds_{timestamp}.xlsx'
-            df.to_excel(filename, index=False, engine='openpyxl')
-        else:
+            self._write_excel(df, filename)
+        elif format in ('feather', 'parquet'):
+            # pyarrow is only needed for the columnar formats, so import it lazily
+            import pyarrow  # noqa: F401
+
+            df = self._categorize(df)
+            if format == 'feather':
+                df.to_feather(filename, compression='zstd')
+            else:
+                df.to_parquet(filename, compression='zstd', index=False)
+
+    def _save_latest(self, filename: Path, format: str) -> Path:
+        """
+        Point the "latest" name at an already written output file
+
+        The latest file is a hard link to the timestamped file, so nothing is serialized
+        twice and it stays valid if old timestamped files are pruned. Where hard links
+        are unavailable the file is copied instead.
+
+        Args:
+            filename: Timestamped file that was written
+            format: Output format of the file
+
+        Returns:
+            Path to the latest file
+        """
+        latest_filename = self.data_output_dir / f'pasardana_funds_latest.{self._extension(format)}'
+        latest_filename.unlink(missing_ok=True)
+        try:
+            os.link(filename, latest_filename)
+        except OSError:
+            shutil.copyfile(filename, latest_filename)
+        logger.info(f"Latest data saved to {latest_filename}")
+        return latest_filename
+
+    def _page_writer(self, filename: Path, format: str) -> Optional[PageWriter]:
+        """
+        Create a writer that streams scraped pages to a file in the given format
+
+        Args:
+            filename: Destination path
+            format: Output format
+
+        Returns:
+            Page writer, or None if the format can only be written in one go (Excel)
+        """
+        if format == 'feather':
+            return FeatherPageWriter(filename)
+        if format == 'parquet':
+            return ParquetPageWriter(filename)
+        if format == 'csv':
+            return CsvPageWriter(filename, self.compression_level)
+        if format == 'json':
+            return JsonPageWriter(filename, self.compression_level)
+        return None
+
+    def save_data(self, df: pd.DataFrame, format: str = 'feather', timestamp: Optional[str] = None) -> Path:
+        """
+        Save scraped data to file
+
+        Args:
+            df: DataFrame containing scraped data
+            format: Output format ('feather', 'parquet', 'csv', 'json', 'excel')
+            timestamp: Timestamp for the file name, so every format of one run shares it; defaults to now
+
+        Returns:
+            Path to saved file
+        """
+        if format not in OUTPUT_EXTENSIONS:
             raise ValueError(f"Unsupported format: {format}")
 
+        timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+        extension = self._extension(format)
+
+        filename = self.data_output_dir / f'pasardana_funds_{timestamp}.{extension}'
+        self._write_file(df, filename, format)
         logger.info(f"Data saved to {filename}")
 
         # Also save as latest
-        latest_filename = self.data_output_dir / f'pasardana_funds_latest.{format}'
-        if format == 'csv':
-            df.to_csv(latest_filename, index=False, encoding='utf-8-sig')
-        elif format == 'json':
-            df.to_json(latest_filename, orient='records', indent=2, force_ascii=False)
-        elif format == 'excel':
-            df.to_excel(latest_filename, index=False, engine='openpyxl')
-
-        logger.info(f"Latest data saved to {latest_filename}")
+        self._save_latest(filename, format)
 
         return filename
 
-    async def run(self, output_formats: List[str] = ['csv', 'json']) -> Dict[str, Path]:
+    async def run(self, output_formats: List[str] = ['feather', 'parquet']) -> Dict[str, Path]:
         """
         Run the complete scraping process
 
@@ -458,31 +1370,94 @@ class PasardanaScraper:
         Returns:
             Dictionary mapping format to file path
         """
-        logger.info("Starting Pasardana scraping process")
+        # Only one scrape+save may be in flight at a time
+        async with self._inflight:
+            logger.info("Starting Pasardana scraping process")
+            # Every output file of this run shares one timestamp
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+            # Scrape data, preferring the JSON API when one is configured, then plain HTTP
+            df = await self.scrape_api() if self.api_url else None
+            if df is None and self.static_fetch:
+                df = await self.scrape_static()
+
+            # When scraping in the browser, output is streamed to disk page by page as it arrives
+            page_writers = {}
+            failed_formats = set()
+            if df is None:
+                for fmt in output_formats:
+                    if fmt in OUTPUT_EXTENSIONS:
+                        filename = self.data_output_dir / f'pasardana_funds_{timestamp}.{self._extension(fmt)}'
+                        page_writer = self._page_writer(filename, fmt)
+                        if page_writer is not None:
+                            page_writers[fmt] = page_writer
+
+                # Pages only need to stay in memory for formats that can't be streamed
+                keep_frames = not page_writers or any(fmt not in page_writers for fmt in output_formats)
+                success = False
+                try:
+                    df = await self.scrape_all_pages(list(page_writers.values()), keep_frames)
+                    success = True
+                finally:
+                    # Close every writer, even if one of them fails
+                    for fmt, page_writer in page_writers.items():
+                        try:
+                            page_writer.close(success)
+                        except Exception as e:
+                            logger.error(f"Error saving {fmt} format: {str(e)}")
+                            failed_formats.add(fmt)
+
+            if df is not None:
+                total_records, columns = len(df), list(df.columns)
+            else:
+                streamed = next(iter(page_writers.values()))
+                total_records, columns = streamed.rows_written, streamed.columns or []
+
+            if not total_records:
+                logger.error("No data scraped, exiting")
+                return {}
+
+            # Display summary
+            logger.info(f"\nData Summary:")
+            logger.info(f"Total records: {total_records}")
+            logger.info(f"Columns: {columns}")
+
+            saved_files = {}
+            for fmt, page_writer in page_writers.items():
+                if page_writer.rows_written and fmt not in failed_formats:
+                    logger.info(f"Data streamed to {page_writer.path}")
+                    self._save_latest(page_writer.path, fmt)
+                    saved_files[fmt] = page_writer.path
+            remaining_formats = [fmt for fmt in output_formats if fmt not in page_writers]
+
+            # Save in multiple formats concurrently
+            results = await asyncio.gather(
+                *[asyncio.to_thread(self.save_data, df, fmt, timestamp) for fmt in remaining_formats],
+                return_exceptions=True
+            )
 
-        # Scrape data
-        df = await self.scrape_all_pages()
+            for fmt, result in zip(remaining_formats, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error saving {fmt} format: {str(result)}")
+                else:
+                    saved_files[fmt] = result
 
-        if df.empty:
-            logger.error("No data scraped, exiting")
-            return {}
+            logger.info("Scraping process completed successfully")
+            return saved_files
 
-        # Display summary
-        logger.info(f"\nData Summary:")
-        logger.info(f"Total records: {len(df)}")
-        logger.info(f"Columns: {list(df.columns)}")
 
-        # Save in multiple formats
-        saved_files = {}
-        for fmt in output_formats:
-            try:
-                filepath = self.save_data(df, fmt)
-                saved_files[fmt] = filepath
-            except Exception as e:
-                logger.error(f"Error saving {fmt} format: {str(e)}")
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop, backed by uvloop when it is installed
 
-        logger.info("Scraping process completed successfully")
-        return saved_files
+    Returns:
+        New event loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
 
 
 async def main():
@@ -491,11 +1466,15 @@ async def main():
     scraper = PasardanaScraper(headless=headless)
 
     try:
-        await scraper.run(output_formats=['csv', 'json'])
+        await scraper.run(output_formats=['feather', 'parquet'])
     except Exception as e:
         logger.error(f"Scraping failed: {str(e)}")
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    loop = new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()